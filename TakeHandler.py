@@ -2,6 +2,7 @@ import os
 import sys
 import json
 import re
+import functools
 from pyfbsdk import *
 from pyfbsdk_additions import *
 import PySide6
@@ -12,7 +13,7 @@ from PySide6.QtWidgets import (QApplication, QMainWindow, QListWidget, QListWidg
                                QSizeGrip, QGroupBox, QCheckBox, QGridLayout, QButtonGroup,
                                QColorDialog)
 from PySide6.QtGui import QColor, QBrush, QPainter, QPen, QPolygon, QCursor, QFont
-from PySide6.QtCore import Qt, QTimer, Signal, QObject, QRect, QPoint
+from PySide6.QtCore import Qt, QTimer, Signal, QObject, QRect, QPoint, QMetaObject, QSignalBlocker
 
 def get_motionbuilder_main_window():
     """Find the main MotionBuilder window/QWidget."""
@@ -36,13 +37,26 @@ def get_motionbuilder_main_window():
     return None
 
 # Helper: strip numerical prefix from take names.
+# Called for every take on every rebuild/paint; the result only depends on the name,
+# so memoize it (bounded, and never stale since renamed takes simply miss the cache).
+_TAKE_PREFIX_RE = re.compile(r'^\d+\s*-\s*')
+
+@functools.lru_cache(maxsize=4096)
 def strip_prefix(name):
-    return re.sub(r'^\d+\s*-\s*', '', name)
+    return _TAKE_PREFIX_RE.sub('', name)
+
+def split_prefix(name):
+    """Split a take name into (numerical prefix, stripped name)."""
+    match = _TAKE_PREFIX_RE.match(name)
+    end = match.end() if match else 0
+    return name[:end], name[end:]
 
 # Helper: check if a take is a group take
+_GROUP_TAKE_PREFIXES = ('==', '--')
+
 def is_group_take(take_name):
     """Check if a take name indicates a group take (starts with == or --)."""
-    return take_name.startswith('==') or take_name.startswith('--')
+    return take_name.startswith(_GROUP_TAKE_PREFIXES)
 
 def get_settings_path():
     """Get the global settings path for window geometry"""
@@ -58,6 +72,16 @@ def get_global_settings_path():
         os.makedirs(base_dir)
     return os.path.join(base_dir, "PythonScriptGlobalSettings.json")
 
+# Default current take highlight color; the QColor is resolved from the name once at import
+DEFAULT_CURRENT_TAKE_COLOR = "yellow"
+_DEFAULT_CURRENT_TAKE_QCOLOR = QColor(DEFAULT_CURRENT_TAKE_COLOR)
+
+def current_take_qcolor(color_name):
+    """Get a QColor for a current take color name, reusing the default without a name lookup"""
+    if color_name == DEFAULT_CURRENT_TAKE_COLOR:
+        return QColor(_DEFAULT_CURRENT_TAKE_QCOLOR)
+    return QColor(color_name)
+
 def load_global_settings():
     """Load global script settings"""
     settings_path = get_global_settings_path()
@@ -69,7 +93,7 @@ def load_global_settings():
             "direction_style": "none"  # "none", "short", "full", "mixed", "single"
         },
         "accessibility": {
-            "current_take_color": "yellow"
+            "current_take_color": DEFAULT_CURRENT_TAKE_COLOR
         }
     }
     
@@ -417,40 +441,54 @@ class NotesDialog(QDialog):
 
 class TakeListItem(QListWidgetItem):
     """Custom list item for takes."""
-    def __init__(self, take_name, is_current=False, tag="", color=None, is_favorite=False, parent_group=None, visible=True, note="", note_color=None):
+    def __init__(self, take_name, is_current=False, tag="", color=None, is_favorite=False, parent_group=None, visible=True, note="", note_color=None, is_group=None):
         super(TakeListItem, self).__init__()
         self.take_name = take_name  # This is the stripped (original) name.
         self.tag = tag
         self.color = color or QColor(200, 200, 200)
         self.is_favorite = is_favorite
-        self.is_group = is_group_take(take_name)
+        # Callers that already classified the take (e.g. the list rebuild) pass is_group in
+        self.is_group = is_group_take(take_name) if is_group is None else is_group
         self.parent_group = parent_group  # Name of the parent group take
         self.visible = visible  # Whether this take should be visible based on group collapse
         self.note = note
         self.note_color = note_color or QColor(255, 255, 255)
-        self.update_display(is_current)
-    
-    def update_display(self, is_current=False):
+        
+        # Static display data is written once here; update_display only handles current-take state
         self.setText(self.take_name)
-        font = self.font()
-        font.setBold(is_current or self.is_group)  # Make group takes bold
-        self.setFont(font)
-        self.setData(Qt.UserRole, self.color)
-        if self.is_favorite:
-            self.setData(Qt.UserRole + 1, True)
-        self.setData(Qt.UserRole + 2, bool(self.tag))
-        self.setData(Qt.UserRole + 3, self.is_group)  # Store group status for delegate
-        self.setData(Qt.UserRole + 4, bool(self.note))  # Has note
-        self.setData(Qt.UserRole + 5, self.note_color)  # Note color
-        self.setData(Qt.UserRole + 6, self.note)  # Note text for tooltip
+        role_data = (
+            self.color,             # UserRole: tag/group color
+            self.is_favorite,       # UserRole + 1: favorite star
+            bool(self.tag),         # UserRole + 2: has tag
+            self.is_group,          # UserRole + 3: group status for delegate
+            bool(self.note),        # UserRole + 4: has note
+            self.note_color,        # UserRole + 5: note color
+            self.note,              # UserRole + 6: note text for tooltip
+        )
+        for role, value in enumerate(role_data, start=int(Qt.UserRole)):
+            self.setData(role, value)
         
         # Set tooltip if there's a note
         if self.note:
             self.setToolTip(self.note)
-        else:
-            self.setToolTip("")
-            
-        self.setHidden(not self.visible)  # Hide/show based on group collapse state
+        
+        self.set_visible(self.visible)  # Hide/show based on group collapse state
+        self.update_display(is_current)
+    
+    def update_display(self, is_current=False):
+        """Update the bold state for the current take (group takes are always bold)."""
+        bold = is_current or self.is_group
+        font = self.font()
+        if font.bold() != bold:
+            font.setBold(bold)
+            self.setFont(font)
+    
+    def set_visible(self, visible):
+        """Set group-collapse visibility, only touching Qt when the hidden state changes."""
+        self.visible = visible
+        want_hidden = not visible
+        if self.isHidden() != want_hidden:
+            self.setHidden(want_hidden)  # setHidden invalidates the list layout even when unchanged
 
 class DraggableListWidget(QListWidget):
     """List widget with drag and drop support and in-place editing."""
@@ -818,7 +856,14 @@ class TakeHandlerWindow(QMainWindow):
         self.setMinimumSize(100, 100)
         self.system = FBSystem()
         self.take_data = {}  # Config data keyed by the take's original (stripped) name.
+        self.take_items = {}  # List items keyed by stripped name, rebuilt with the list
         self.config_path = self._get_config_path()
+        
+        # Debounce config writes so bursts of edits (e.g. group toggles) hit disk once
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._do_save_config)
         self.monitor = TakeChangeMonitor()
         self.monitor.takeChanged.connect(self.update_take_list)
         self.monitor.currentTakeChanged.connect(self.update_current_take_only)  # Connect the fast update for current take changes
@@ -826,6 +871,11 @@ class TakeHandlerWindow(QMainWindow):
         # Track expanded/collapsed state of groups
         self.expanded_groups = {}
         
+        # State the take list was last built from, used to skip redundant rebuilds.
+        # _data_revision is bumped whenever take_data changes (see _save_config).
+        self._last_list_state = None
+        self._data_revision = 0
+        
         # Create a central widget with default system styling
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -836,6 +886,9 @@ class TakeHandlerWindow(QMainWindow):
         
         self.take_list = DraggableListWidget(window=self)  # Pass self as the window parameter
         self.take_list.setSelectionMode(QListWidget.ExtendedSelection)  # Allow multi-select
+        # All rows share one height, so the view can skip per-item size hints when laying out
+        # (collapsed group children stay as cheap hidden items rather than being removed)
+        self.take_list.setUniformItemSizes(True)
         self.take_list.itemDoubleClicked.connect(self.on_item_double_click)
         self.take_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.take_list.customContextMenuRequested.connect(self._show_context_menu)
@@ -928,8 +981,14 @@ class TakeHandlerWindow(QMainWindow):
         # without needing an explicit size grip
         
         self._load_config()
+        self._refresh_accessibility_cache()
         self.update_take_list()
     
+    def _refresh_accessibility_cache(self):
+        """Cache accessibility settings used by the delegate so paint never touches disk."""
+        accessibility = load_global_settings().get("accessibility", {})
+        self._current_take_qcolor = current_take_qcolor(accessibility.get("current_take_color", DEFAULT_CURRENT_TAKE_COLOR))
+    
     def _get_config_path(self):
         base_dir = os.path.expanduser("~/Documents/MB/CustomPythonSaveData/TakesManager")
         if not os.path.exists(base_dir):
@@ -964,6 +1023,13 @@ class TakeHandlerWindow(QMainWindow):
                 pass  # Error loading configuration
     
     def _save_config(self):
+        """Schedule a config save; restarts the debounce timer on each call."""
+        self._data_revision += 1  # Take data changed, so the list must be rebuilt next time
+        self._save_timer.start()
+    
+    def _do_save_config(self):
+        """Write the config to disk immediately."""
+        self._save_timer.stop()
         save_data = {}
         for take_name, data in self.take_data.items():
             save_data[take_name] = data.copy()
@@ -1564,6 +1630,10 @@ class TakeHandlerWindow(QMainWindow):
         """Open the Take Handler Settings dialog"""
         settings_dialog = TakeHandlerSettings(self)
         settings_dialog.exec_()
+        
+        # Settings may have changed - refresh cached values and repaint
+        self._refresh_accessibility_cache()
+        self.take_list.viewport().update()
     
     def _create_new_take(self):
         name, ok = QInputDialog.getText(self, "New Take", "Enter take name:")
@@ -2723,11 +2793,13 @@ class TakeHandlerWindow(QMainWindow):
     def _start_inline_rename(self, take_name):
         """Safely start the inline rename by finding the item from the take name"""
         # Find the item by take name rather than using the direct reference
-        for i in range(self.take_list.count()):
-            item = self.take_list.item(i)
-            if item and item.take_name == take_name and not item.isHidden():
-                self.take_list.editItem(item)
-                break
+        item = self.take_items.get(take_name)
+        if item and item.isHidden():
+            # Cached item is a collapsed duplicate; fall back to the first visible match
+            item = next((self.take_list.item(i) for i in range(self.take_list.count())
+                         if self.take_list.item(i).take_name == take_name and not self.take_list.item(i).isHidden()), None)
+        if item and not item.isHidden():
+            self.take_list.editItem(item)
     
     def _rename_take(self, take_name):
         """Legacy dialog-based rename method (kept for reference or multi-selection)"""
@@ -2828,6 +2900,14 @@ class TakeHandlerWindow(QMainWindow):
         if hasattr(self.take_list, 'internal_drop') and self.take_list.internal_drop:
             return
         
+        # Skip the rebuild entirely if nothing it depends on has changed
+        system = FBSystem()
+        take_names = tuple(take.Name for take in system.Scene.Takes)
+        current_take_clean = strip_prefix(system.CurrentTake.Name) if system.CurrentTake else ""
+        state = (take_names, tuple(sorted(self.expanded_groups.items())), current_take_clean, self._data_revision)
+        if state == self._last_list_state:
+            return
+        
         # Save scroll position before clearing
         scroll_value = 0
         if preserve_scroll:
@@ -2835,10 +2915,7 @@ class TakeHandlerWindow(QMainWindow):
             scroll_value = scrollbar.value()
         
         self.take_list.clear()
-        system = FBSystem()
-        current_take_clean = ""
-        if system.CurrentTake:
-            current_take_clean = strip_prefix(system.CurrentTake.Name)
+        self.take_items = {}
         
         # First pass: collect all takes and identify group takes
         all_takes = []
@@ -2846,10 +2923,14 @@ class TakeHandlerWindow(QMainWindow):
         for i in range(len(system.Scene.Takes)):
             take = system.Scene.Takes[i]
             take_name_clean = strip_prefix(take.Name)
-            take_data = self._get_take_data(take_name_clean)
+            # Direct dict lookup; only fall back to _get_take_data (which creates defaults) for new takes
+            take_data = self.take_data.get(take_name_clean)
+            if take_data is None:
+                take_data = self._get_take_data(take_name_clean)
             
             # If this is a group take, start a new group
-            if is_group_take(take_name_clean):
+            is_group = is_group_take(take_name_clean)
+            if is_group:
                 current_group = take_name_clean
                 # Initialize group expanded state if not already set
                 if current_group not in self.expanded_groups:
@@ -2870,10 +2951,15 @@ class TakeHandlerWindow(QMainWindow):
                 parent_group=current_group if take_name_clean != current_group else None,
                 visible=visible,
                 note=take_data.get('note', ''),
-                note_color=take_data.get('note_color', QColor(255, 255, 255))
+                note_color=take_data.get('note_color'),  # TakeListItem defaults to white
+                is_group=is_group
             )
             
             all_takes.append(item)
+            # First visible item wins, matching list order; a hidden one only until a visible duplicate shows up
+            existing = self.take_items.get(take_name_clean)
+            if existing is None or (not existing.visible and visible):
+                self.take_items[take_name_clean] = item
         
         # Add all takes to the list and ensure visibility is set correctly
         for item in all_takes:
@@ -2881,6 +2967,9 @@ class TakeHandlerWindow(QMainWindow):
             if not item.visible:
                 item.setHidden(True)
         
+        # Remember the state after the rebuild (new groups get default expanded entries above)
+        self._last_list_state = (take_names, tuple(sorted(self.expanded_groups.items())), current_take_clean, self._data_revision)
+        
         # Don't restore selection to avoid interfering with the list
         # Selection will be handled by the dropEvent's delayed selection
         
@@ -2929,8 +3018,7 @@ class TakeHandlerWindow(QMainWindow):
                         for j in range(self.take_list.count()):
                             child_item = self.take_list.item(j)
                             if child_item and getattr(child_item, 'parent_group', None) == group_item_name:
-                                child_item.visible = new_state
-                                child_item.setHidden(not new_state)
+                                child_item.set_visible(new_state)
             else:
                 # Normal click: toggle just this group
                 self.expanded_groups[group_name] = not self.expanded_groups.get(group_name, True)
@@ -2939,8 +3027,7 @@ class TakeHandlerWindow(QMainWindow):
                 for i in range(self.take_list.count()):
                     child_item = self.take_list.item(i)
                     if child_item and getattr(child_item, 'parent_group', None) == group_name:
-                        child_item.visible = self.expanded_groups[group_name]
-                        child_item.setHidden(not child_item.visible)
+                        child_item.set_visible(self.expanded_groups[group_name])
             
             # Deselect everything after all-groups toggle to avoid selection artifacts
             if all_groups_toggle:
@@ -2965,8 +3052,7 @@ class TakeHandlerWindow(QMainWindow):
             for i in range(self.take_list.count()):
                 child_item = self.take_list.item(i)
                 if child_item and child_item.parent_group == group_name:
-                    child_item.visible = self.expanded_groups[group_name]
-                    child_item.setHidden(not child_item.visible)
+                    child_item.set_visible(self.expanded_groups[group_name])
             
             # Save the expanded state
             self._save_config()
@@ -2978,19 +3064,15 @@ class TakeHandlerWindow(QMainWindow):
                 take = system.Scene.Takes[i]
                 if strip_prefix(take.Name) == selected_take_clean:
                     system.CurrentTake = take
-                    # Force deselection by setting current item to None after update
-                    def deselect_after_update():
-                        self.take_list.setCurrentItem(None)
-                        self.take_list.clearSelection()
-                    
-                    # Schedule deselection after update completes
-                    QTimer.singleShot(100, deselect_after_update)
+                    # Clear current item and selection in one call, queued so it runs after the
+                    # double-click has been fully processed by the view
+                    QMetaObject.invokeMethod(self.take_list.selectionModel(), "clear", Qt.QueuedConnection)
                     # Use the fast update method to preserve scrollbar position
                     self.update_current_take_only()
                     break
     
     def closeEvent(self, event):
-        self._save_config()
+        self._do_save_config()  # Flush any pending debounced save
         save_window_settings(self)
         event.accept()
 
@@ -2999,6 +3081,16 @@ class TakeListDelegate(QStyledItemDelegate):
     def __init__(self, window=None, parent=None):
         super(TakeListDelegate, self).__init__(parent)
         self.window = window  # Store a reference to the window for accessing expanded_groups
+        
+        # Reusable rects for paint - repositioned per row instead of reallocated
+        self._indicator_rect = QRect(0, 0, 16, 0)
+        self._tag_rect = QRect(0, 0, 8, 0)
+        self._text_rect = QRect()
+        self._icon_rect = QRect(0, 0, 15, 0)
+        
+        # Cached 60% font for the expanded-group arrow, rebuilt only when the base font changes
+        self._small_font_base = None
+        self._small_font = None
     
     def paint(self, painter, option, index):
         color = index.data(Qt.UserRole)
@@ -3039,13 +3131,12 @@ class TakeListDelegate(QStyledItemDelegate):
                 painter.setPen(Qt.white)
             
             # Use small arrow symbols as indicators, positioned at the left edge with no padding
-            indicator_rect = QRect(option.rect.left() + 0, option.rect.top(), 16, option.rect.height())
+            indicator_rect = self._indicator_rect
+            indicator_rect.setRect(option.rect.left(), option.rect.top(), 16, option.rect.height())
             
             if expanded:
                 # Down arrow for expanded - make it smaller
-                smaller_font = QFont(original_font)
-                smaller_font.setPointSizeF(original_font.pointSizeF() * 0.6)  # Make down arrow 60% of normal size
-                painter.setFont(smaller_font)
+                painter.setFont(self._get_small_font(original_font))
                 painter.drawText(indicator_rect, Qt.AlignCenter, "▼")
             else:
                 # Right arrow for collapsed - keep current size
@@ -3062,21 +3153,22 @@ class TakeListDelegate(QStyledItemDelegate):
         # Draw the tag color box (if applicable)
         if has_tag and color and not is_group:
             # Position the color box at the far right edge
-            tag_rect = QRect(option.rect.right() - 10, option.rect.top() + 2, 8, option.rect.height() - 4)
+            tag_rect = self._tag_rect
+            tag_rect.setRect(option.rect.right() - 10, option.rect.top() + 2, 8, option.rect.height() - 4)
             painter.fillRect(tag_rect, QBrush(color))
             painter.setPen(Qt.black)
             painter.drawRect(tag_rect)
         
         # Adjust text rect to account for controls on both sides
-        text_rect = option.rect.adjusted(offset, 0, -right_margin, 0)
+        text_rect = self._text_rect
+        text_rect.setCoords(option.rect.left() + offset, option.rect.top(),
+                            option.rect.right() - right_margin, option.rect.bottom())
         text = index.data(Qt.DisplayRole)
         
         # Set text color - prioritize current take over other coloring
         if is_current:
-            # Current take gets color from settings
-            settings = load_global_settings()
-            current_take_color = settings.get("accessibility", {}).get("current_take_color", "yellow")
-            painter.setPen(QColor(current_take_color))
+            # Current take gets color from settings (cached on the window)
+            painter.setPen(self.window._current_take_qcolor)
         elif text.endswith(" [X]"):
             # Unfinished takes get red tint (20% red, 80% normal)
             base_color = option.palette.text().color()
@@ -3107,18 +3199,28 @@ class TakeListDelegate(QStyledItemDelegate):
         # Draw note icon first (rightmost)
         if has_note:
             painter.setPen(QColor(255, 255, 255))  # White note icon
-            note_rect = QRect(option.rect.right() - 15 - right_offset, option.rect.top(), 15, option.rect.height())
-            painter.drawText(note_rect, Qt.AlignCenter, "📝")  # Note emoji
+            icon_rect = self._icon_rect
+            icon_rect.setRect(option.rect.right() - 15 - right_offset, option.rect.top(), 15, option.rect.height())
+            painter.drawText(icon_rect, Qt.AlignCenter, "📝")  # Note emoji
             right_offset += 15
         
         # Draw star (next to note if it exists)
         if is_favorite:
             painter.setPen(QColor(255, 215, 0))
-            star_rect = QRect(option.rect.right() - 15 - right_offset, option.rect.top(), 15, option.rect.height())
-            painter.drawText(star_rect, Qt.AlignCenter, "★")
+            icon_rect = self._icon_rect
+            icon_rect.setRect(option.rect.right() - 15 - right_offset, option.rect.top(), 15, option.rect.height())
+            painter.drawText(icon_rect, Qt.AlignCenter, "★")
         
         painter.restore()
     
+    def _get_small_font(self, base_font):
+        """Return the cached down-arrow font (60% of base), refreshing it if the base font changed."""
+        if self._small_font is None or base_font != self._small_font_base:
+            self._small_font_base = QFont(base_font)
+            self._small_font = QFont(base_font)
+            self._small_font.setPointSizeF(base_font.pointSizeF() * 0.6)  # Make down arrow 60% of normal size
+        return self._small_font
+    
 
 def show_take_handler():
     """Show the Take Handler window."""
@@ -3136,6 +3238,54 @@ def show_take_handler():
     window.take_list.setItemDelegate(delegate)
     return window
 
+def create_tooltip_html(original, result, highlight_ranges):
+    """Create HTML tooltip with highlighted differences"""
+    # Single forward pass over the (non-overlapping) ranges, collecting segments to join
+    parts = []
+    pos = 0
+    for start, end in sorted(highlight_ranges):
+        if start < len(result) and end <= len(result):
+            parts.append(result[pos:start])
+            parts.append("<span style='background-color: yellow; color: black;'>")
+            parts.append(result[start:end])
+            parts.append("</span>")
+            pos = end
+    parts.append(result[pos:])
+    highlighted_result = "".join(parts)
+    
+    return f"""
+    <div style='font-family: monospace; font-size: 12px;'>
+        <b>Before:</b> {original}<br>
+        <b>After:</b> {highlighted_result}
+    </div>
+    """
+
+# Color swatch button stylesheets keyed by color name, shared across dialog instances
+_COLOR_BUTTON_QSS_CACHE = {}
+
+def _color_button_qss(color_name):
+    """Get the (cached) swatch button stylesheet for a color name"""
+    qss = _COLOR_BUTTON_QSS_CACHE.get(color_name)
+    if qss is None:
+        qss = f"background-color: {color_name}; border: 1px solid #666;"
+        _COLOR_BUTTON_QSS_CACHE[color_name] = qss
+    return qss
+
+# Naming convention tooltip examples: (key, result, highlighted ranges in result)
+_TOOLTIP_EXAMPLE_NAME = "take_right_left_Forward_Backward"
+_TOOLTIP_SPECS = [
+    ("first_capital", "Take_right_left_Forward_Backward", [(0, 4)]),  # "take" -> "Take"
+    ("no_capitals", "take_right_left_forward_backward", [(13, 20), (26, 34)]),  # "Forward" -> "forward", "Backward" -> "backward"
+    ("no_spaces", "take_right_left_Forward_Backward", []),  # No changes for this example
+    ("rgt_lft", "take_Rgt_Lft_Fwd_Bwd", [(5, 10), (11, 15), (16, 23), (24, 32)]),  # All direction words
+    ("right_left", "take_Right_Left_Forward_Backward", [(5, 10), (11, 15)]),  # "right" -> "Right", "left" -> "Left"
+    ("right_left_fwd", "take_Right_Left_Fwd_Bwd", [(5, 10), (11, 15), (16, 23), (24, 32)]),  # All direction words
+    ("single_letter", "take_r_l_f_b", [(5, 10), (11, 15), (16, 23), (24, 32)]),  # All direction words
+]
+# The inputs are constant, so build the HTML once at import instead of per dialog
+_TOOLTIP_HTML = {key: create_tooltip_html(_TOOLTIP_EXAMPLE_NAME, result, ranges)
+                 for key, result, ranges in _TOOLTIP_SPECS}
+
 class TakeHandlerSettings(QDialog):
     """Settings dialog for Take Handler with expandable sections"""
     
@@ -3144,10 +3294,17 @@ class TakeHandlerSettings(QDialog):
         self.setWindowTitle("Take Handler Settings")
         self.setMinimumSize(400, 300)
         
-        # Track expansion states
-        self.take_naming_expanded = True  # Expanded by default
-        self.tags_expanded = False
-        self.accessibility_expanded = False
+        # Track expansion states per collapsible section (take naming expanded by default)
+        self._expanded = {"take_naming": True, "tags": False, "accessibility": False}
+        
+        # Current take color name, kept here instead of parsed back out of the button stylesheet
+        self._current_take_color = DEFAULT_CURRENT_TAKE_COLOR
+        self.current_take_color_button = None  # Created when the accessibility section is first expanded
+        self._styled_take_color = None  # Color currently applied to the button stylesheet
+        
+        # Number of tag rows, recounted only after the tag list changes
+        self._cached_tag_count = 0
+        self._tag_count_dirty = True
         
         self.setup_ui()
         self.load_settings()
@@ -3163,6 +3320,20 @@ class TakeHandlerSettings(QDialog):
         self.create_tags_group(main_layout)
         self.create_accessibility_group(main_layout)
         
+        # Collapsible sections: key -> (group box, content container, title, expanded height).
+        # An expanded height of None means it is computed on expand (see _expanded_height).
+        self._collapsible = {
+            "take_naming": (self.take_naming_group, self.take_naming_container, "Take Naming Convention", 160),  # Height for 4 rows of content
+            "tags": (self.tags_group, self.tags_container, "Tags", None),
+            "accessibility": (self.accessibility_group, self.accessibility_container, "Accessibility", 70),  # Height for color picker
+        }
+        
+        # Contents of collapsed-by-default sections are built on first expand
+        self._lazy_builders = {
+            "tags": self.populate_existing_tags,
+            "accessibility": self._build_accessibility_contents,
+        }
+        
         # Add stretch to push everything to the top
         main_layout.addStretch()
         
@@ -3188,7 +3359,7 @@ class TakeHandlerSettings(QDialog):
         # Create collapsible group (collapsed by default)
         group_box = QGroupBox("► Take Naming Convention")
         group_box.setStyleSheet(self.get_collapsible_group_style())
-        group_box.mousePressEvent = lambda event: self.on_take_naming_clicked()
+        group_box.mousePressEvent = lambda event: self._toggle_group("take_naming")
         
         self.take_naming_group = group_box
         group_layout = QVBoxLayout()
@@ -3211,6 +3382,14 @@ class TakeHandlerSettings(QDialog):
         self.right_left_fwd_cb = QCheckBox("Right, Left, Fwd, Bwd")
         self.single_letter_cb = QCheckBox("r, l, f, b")
         
+        # Direction style -> checkbox (insertion order is the checked-priority order)
+        self._dir_cbs = {
+            "short": self.rgt_lft_cb,
+            "full": self.right_left_cb,
+            "mixed": self.right_left_fwd_cb,
+            "single": self.single_letter_cb,
+        }
+        
         # Set up tooltips with examples
         self.setup_tooltips()
         
@@ -3251,7 +3430,7 @@ class TakeHandlerSettings(QDialog):
         group_box.setLayout(group_layout)
         
         # Set initial state (expanded by default)
-        if self.take_naming_expanded:
+        if self._expanded["take_naming"]:
             self.take_naming_container.setVisible(True)
             group_box.setFixedHeight(160)  # Expanded height
             group_box.setTitle("▼ Take Naming Convention")
@@ -3267,7 +3446,7 @@ class TakeHandlerSettings(QDialog):
         # Create collapsible group (collapsed by default)
         group_box = QGroupBox("► Tags")
         group_box.setStyleSheet(self.get_collapsible_group_style())
-        group_box.mousePressEvent = lambda event: self.on_tags_clicked()
+        group_box.mousePressEvent = lambda event: self._toggle_group("tags")
         
         self.tags_group = group_box
         group_layout = QVBoxLayout()
@@ -3302,8 +3481,7 @@ class TakeHandlerSettings(QDialog):
         
         parent_layout.addWidget(group_box)
         
-        # Populate existing tags
-        self.populate_existing_tags()
+        # Existing tags are populated on first expand (see _lazy_builders)
     
     def get_collapsible_group_style(self):
         """Get the CSS style for collapsible groups (matching Controlify exactly)"""
@@ -3336,6 +3514,7 @@ class TakeHandlerSettings(QDialog):
                 child = self.tags_list_layout.takeAt(0)
                 if child.widget():
                     child.widget().deleteLater()
+            self._tag_count_dirty = True
             
             # Add each tag with edit button
             for tag_name in existing_tags:
@@ -3362,6 +3541,7 @@ class TakeHandlerSettings(QDialog):
         
         tag_widget.setLayout(tag_layout)
         self.tags_list_layout.addWidget(tag_widget)
+        self._tag_count_dirty = True
     
     def create_new_tag(self):
         """Create a new tag using the TagDialog"""
@@ -3413,200 +3593,133 @@ class TakeHandlerSettings(QDialog):
         # Create collapsible group (collapsed by default)
         group_box = QGroupBox("► Accessibility")
         group_box.setStyleSheet(self.get_collapsible_group_style())
-        group_box.mousePressEvent = lambda event: self.on_accessibility_clicked()
+        group_box.mousePressEvent = lambda event: self._toggle_group("accessibility")
         
         self.accessibility_group = group_box
         group_layout = QVBoxLayout()
         group_layout.setContentsMargins(5, 15, 5, 5)
         
-        # Content container (hidden by default)
+        # Content container (hidden by default, contents built on first expand)
         self.accessibility_container = QWidget()
         container_layout = QVBoxLayout()
         container_layout.setContentsMargins(0, 0, 0, 0)
         container_layout.setSpacing(5)
         
+        self.accessibility_container.setLayout(container_layout)
+        self.accessibility_container.setVisible(False)  # Hidden by default
+        
+        group_layout.addWidget(self.accessibility_container)
+        group_box.setLayout(group_layout)
+        group_box.setFixedHeight(30)  # Collapsed height
+        
+        parent_layout.addWidget(group_box)
+    
+    def _build_accessibility_contents(self):
+        """Build the Accessibility section contents"""
         # Current take color setting
         color_layout = QHBoxLayout()
         color_label = QLabel("Current take color:")
         color_layout.addWidget(color_label)
         
-        # Color picker button - start with default yellow
+        # Color picker button, styled with the loaded current take color
         self.current_take_color_button = QPushButton()
         self.current_take_color_button.setFixedSize(30, 20)
-        self.current_take_color_button.setStyleSheet("background-color: yellow; border: 1px solid #666;")
+        self._update_current_take_color_button()
         self.current_take_color_button.clicked.connect(self.choose_current_take_color)
         color_layout.addWidget(self.current_take_color_button)
         
         color_layout.addStretch()
-        container_layout.addLayout(color_layout)
-        
-        self.accessibility_container.setLayout(container_layout)
-        self.accessibility_container.setVisible(False)  # Hidden by default
-        
-        group_layout.addWidget(self.accessibility_container)
-        group_box.setLayout(group_layout)
-        group_box.setFixedHeight(30)  # Collapsed height
-        
-        parent_layout.addWidget(group_box)
+        self.accessibility_container.layout().addLayout(color_layout)
+    
+    def _toggle_group(self, key):
+        """Toggle a collapsible section's visibility"""
+        group_box, container, title, _ = self._collapsible[key]
+        expanded = not self._expanded[key]
+        self._expanded[key] = expanded
+        
+        # Build collapsed-by-default contents the first time they are shown
+        if expanded and key in self._lazy_builders:
+            self._lazy_builders.pop(key)()
+        
+        # Batch the visibility/height/title changes into a single repaint
+        self.setUpdatesEnabled(False)
+        container.setVisible(expanded)
+        group_box.setFixedHeight(self._expanded_height(key) if expanded else 30)  # 30 = collapsed height
+        group_box.setTitle(f"{'▼' if expanded else '►'} {title}")
+        self.setUpdatesEnabled(True)
+        
+        # Adjust dialog size now; activating the layout first makes the size hint reflect the change
+        self.layout().activate()
+        self.adjustSize()
     
-    def on_accessibility_clicked(self):
-        """Toggle Accessibility group visibility"""
-        if self.accessibility_expanded:
-            # Collapse
-            self.accessibility_container.setVisible(False)
-            self.accessibility_group.setFixedHeight(30)
-            self.accessibility_group.setTitle("► Accessibility")
-            self.accessibility_expanded = False
-        else:
-            # Expand
-            self.accessibility_container.setVisible(True)
-            self.accessibility_group.setFixedHeight(70)  # Height for color picker
-            self.accessibility_group.setTitle("▼ Accessibility")
-            self.accessibility_expanded = True
-        
-        # Adjust dialog size
-        QTimer.singleShot(10, self.adjustSize)
+    def _expanded_height(self, key):
+        """Get the expanded height of a collapsible section"""
+        height = self._collapsible[key][3]
+        if height is None:
+            # Tags: calculate height based on number of tags + create button
+            if self._tag_count_dirty:
+                self._cached_tag_count = self.tags_list_layout.count()
+                self._tag_count_dirty = False
+            height = 60 + (self._cached_tag_count * 25)  # Base height + tag rows
+        return height
     
     def choose_current_take_color(self):
         """Open color picker for current take color"""
         
-        # Get current color from button
-        current_style = self.current_take_color_button.styleSheet()
-        current_color = QColor("yellow")  # Default fallback
-        
-        # Try to extract color from stylesheet
-        if "background-color:" in current_style:
-            color_str = current_style.split("background-color:")[1].split(";")[0].strip()
-            current_color = QColor(color_str)
-        
-        # Open color dialog
-        color = QColorDialog.getColor(current_color, self, "Choose Current Take Color")
+        # Open color dialog starting from the currently chosen color
+        color = QColorDialog.getColor(current_take_qcolor(self._current_take_color), self, "Choose Current Take Color")
         if color.isValid():
-            # Update button color
-            color_name = color.name()
-            self.current_take_color_button.setStyleSheet(f"background-color: {color_name}; border: 1px solid #666;")
-    
-    def on_take_naming_clicked(self):
-        """Toggle Take Naming Convention group visibility"""
-        if self.take_naming_expanded:
-            # Collapse
-            self.take_naming_container.setVisible(False)
-            self.take_naming_group.setFixedHeight(30)
-            self.take_naming_group.setTitle("► Take Naming Convention")
-            self.take_naming_expanded = False
-        else:
-            # Expand
-            self.take_naming_container.setVisible(True)
-            self.take_naming_group.setFixedHeight(160)  # Height for 4 rows of content
-            self.take_naming_group.setTitle("▼ Take Naming Convention")
-            self.take_naming_expanded = True
-        
-        # Adjust dialog size
-        QTimer.singleShot(10, self.adjustSize)
-    
-    def on_tags_clicked(self):
-        """Toggle Tags group visibility"""
-        if self.tags_expanded:
-            # Collapse
-            self.tags_container.setVisible(False)
-            self.tags_group.setFixedHeight(30)
-            self.tags_group.setTitle("► Tags")
-            self.tags_expanded = False
-        else:
-            # Expand
-            self.tags_container.setVisible(True)
-            # Calculate height based on number of tags + create button
-            tag_count = self.tags_list_layout.count()
-            height = 60 + (tag_count * 25)  # Base height + tag rows
-            self.tags_group.setFixedHeight(height)
-            self.tags_group.setTitle("▼ Tags")
-            self.tags_expanded = True
-        
-        # Adjust dialog size
-        QTimer.singleShot(10, self.adjustSize)
+            # Update stored color and button
+            self._current_take_color = color.name()
+            self._update_current_take_color_button()
+    
+    def _update_current_take_color_button(self):
+        """Style the color button with the current take color, skipping the QSS reparse if unchanged"""
+        if self._styled_take_color == self._current_take_color:
+            return
+        self._styled_take_color = self._current_take_color
+        self.current_take_color_button.setStyleSheet(_color_button_qss(self._current_take_color))
     
     def setup_tooltips(self):
         """Set up tooltips for checkboxes with before/after examples"""
-        example_name = "take_right_left_Forward_Backward"
-        
-        # First Capital Letter tooltip
-        first_cap_result = "Take_right_left_Forward_Backward"
-        first_cap_tooltip = self.create_tooltip_html(example_name, first_cap_result, [(0, 4)])  # "take" -> "Take"
-        self.first_capital_cb.setToolTip(first_cap_tooltip)
-        
-        # No Capital Letters tooltip
-        no_caps_result = "take_right_left_forward_backward"
-        no_caps_tooltip = self.create_tooltip_html(example_name, no_caps_result, [(13, 20), (26, 34)])  # "Forward" -> "forward", "Backward" -> "backward"
-        self.no_capitals_cb.setToolTip(no_caps_tooltip)
-        
-        # No Spaces tooltip
-        no_spaces_result = "take_right_left_Forward_Backward"
-        no_spaces_tooltip = self.create_tooltip_html(example_name, no_spaces_result, [])  # No changes for this example
-        self.no_spaces_cb.setToolTip(no_spaces_tooltip)
-        
-        # Direction tooltips
-        rgt_lft_result = "take_Rgt_Lft_Fwd_Bwd"
-        rgt_lft_tooltip = self.create_tooltip_html(example_name, rgt_lft_result, [(5, 10), (11, 15), (16, 23), (24, 32)])  # All direction words
-        self.rgt_lft_cb.setToolTip(rgt_lft_tooltip)
-        
-        right_left_result = "take_Right_Left_Forward_Backward"
-        right_left_tooltip = self.create_tooltip_html(example_name, right_left_result, [(5, 10), (11, 15)])  # "right" -> "Right", "left" -> "Left"
-        self.right_left_cb.setToolTip(right_left_tooltip)
-        
-        right_left_fwd_result = "take_Right_Left_Fwd_Bwd"
-        right_left_fwd_tooltip = self.create_tooltip_html(example_name, right_left_fwd_result, [(5, 10), (11, 15), (16, 23), (24, 32)])  # All direction words
-        self.right_left_fwd_cb.setToolTip(right_left_fwd_tooltip)
-        
-        single_letter_result = "take_r_l_f_b"
-        single_letter_tooltip = self.create_tooltip_html(example_name, single_letter_result, [(5, 10), (11, 15), (16, 23), (24, 32)])  # All direction words
-        self.single_letter_cb.setToolTip(single_letter_tooltip)
-    
-    def create_tooltip_html(self, original, result, highlight_ranges):
-        """Create HTML tooltip with highlighted differences"""
-        # Start with the result string
-        highlighted_result = result
-        
-        # Apply highlighting in reverse order to avoid position shifts
-        for start, end in reversed(highlight_ranges):
-            if start < len(highlighted_result) and end <= len(highlighted_result):
-                before = highlighted_result[:start]
-                highlight = highlighted_result[start:end]
-                after = highlighted_result[end:]
-                highlighted_result = f"{before}<span style='background-color: yellow; color: black;'>{highlight}</span>{after}"
-        
-        return f"""
-        <div style='font-family: monospace; font-size: 12px;'>
-            <b>Before:</b> {original}<br>
-            <b>After:</b> {highlighted_result}
-        </div>
-        """
+        self.first_capital_cb.setToolTip(_TOOLTIP_HTML["first_capital"])
+        self.no_capitals_cb.setToolTip(_TOOLTIP_HTML["no_capitals"])
+        self.no_spaces_cb.setToolTip(_TOOLTIP_HTML["no_spaces"])
+        self.rgt_lft_cb.setToolTip(_TOOLTIP_HTML["rgt_lft"])
+        self.right_left_cb.setToolTip(_TOOLTIP_HTML["right_left"])
+        self.right_left_fwd_cb.setToolTip(_TOOLTIP_HTML["right_left_fwd"])
+        self.single_letter_cb.setToolTip(_TOOLTIP_HTML["single_letter"])
     
     def load_settings(self):
         """Load settings from global settings file"""
         settings = load_global_settings()
         naming = settings.get("naming_convention", {})
+        get = naming.get
         
-        # Load checkbox states
-        self.first_capital_cb.setChecked(naming.get("first_capital_letter", False))
-        self.no_capitals_cb.setChecked(naming.get("no_capital_letters", False))
-        self.no_spaces_cb.setChecked(naming.get("no_spaces", False))
+        # Block toggled signals during the bulk load so the exclusivity handlers don't cascade
+        blockers = [QSignalBlocker(cb) for cb in (self.first_capital_cb, self.no_capitals_cb, self.no_spaces_cb,
+                                                  self.rgt_lft_cb, self.right_left_cb, self.right_left_fwd_cb,
+                                                  self.single_letter_cb)]
+        
+        # Load checkbox states (No Capital Letters wins if both are set, as the handlers would do)
+        no_capitals = get("no_capital_letters", False)
+        self.first_capital_cb.setChecked(get("first_capital_letter", False) and not no_capitals)
+        self.no_capitals_cb.setChecked(no_capitals)
+        self.no_spaces_cb.setChecked(get("no_spaces", False))
         
         # Load direction style
-        direction_style = naming.get("direction_style", "none")
-        if direction_style == "short":
-            self.rgt_lft_cb.setChecked(True)
-        elif direction_style == "full":
-            self.right_left_cb.setChecked(True)
-        elif direction_style == "mixed":
-            self.right_left_fwd_cb.setChecked(True)
-        elif direction_style == "single":
-            self.single_letter_cb.setChecked(True)
+        direction_cb = self._dir_cbs.get(get("direction_style", "none"))
+        if direction_cb:
+            direction_cb.setChecked(True)
+        
+        for blocker in blockers:
+            blocker.unblock()
         
         # Load accessibility settings
         accessibility = settings.get("accessibility", {})
-        current_take_color = accessibility.get("current_take_color", "yellow")
-        if hasattr(self, 'current_take_color_button'):
-            self.current_take_color_button.setStyleSheet(f"background-color: {current_take_color}; border: 1px solid #666;")
+        self._current_take_color = accessibility.get("current_take_color", DEFAULT_CURRENT_TAKE_COLOR)
+        if self.current_take_color_button is not None:
+            self._update_current_take_color_button()
     
     def on_first_capital_toggled(self, checked):
         """Handle First Capital Letter checkbox toggle"""
@@ -3621,45 +3734,17 @@ class TakeHandlerSettings(QDialog):
     def on_direction_toggled(self, checked, style):
         """Handle direction checkbox toggle (mutual exclusivity)"""
         if checked:
-            # Uncheck all other direction checkboxes
-            if style != "short":
-                self.rgt_lft_cb.setChecked(False)
-            if style != "full":
-                self.right_left_cb.setChecked(False)
-            if style != "mixed":
-                self.right_left_fwd_cb.setChecked(False)
-            if style != "single":
-                self.single_letter_cb.setChecked(False)
-            
-            # Set the current one back to checked
-            if style == "short":
-                self.rgt_lft_cb.setChecked(True)
-            elif style == "full":
-                self.right_left_cb.setChecked(True)
-            elif style == "mixed":
-                self.right_left_fwd_cb.setChecked(True)
-            elif style == "single":
-                self.single_letter_cb.setChecked(True)
+            # Uncheck all other direction checkboxes (the toggled one is already checked).
+            # Signals are blocked so the unchecks don't re-enter this handler.
+            for other_style, checkbox in self._dir_cbs.items():
+                if other_style != style:
+                    checkbox.blockSignals(True)
+                    checkbox.setChecked(False)
+                    checkbox.blockSignals(False)
     
     def get_current_settings(self):
         """Get current settings from the dialog"""
-        direction_style = "none"
-        if self.rgt_lft_cb.isChecked():
-            direction_style = "short"
-        elif self.right_left_cb.isChecked():
-            direction_style = "full"
-        elif self.right_left_fwd_cb.isChecked():
-            direction_style = "mixed"
-        elif self.single_letter_cb.isChecked():
-            direction_style = "single"
-        
-        # Get current take color from button
-        current_take_color = "yellow"  # Default
-        if hasattr(self, 'current_take_color_button'):
-            style = self.current_take_color_button.styleSheet()
-            if "background-color:" in style:
-                color_str = style.split("background-color:")[1].split(";")[0].strip()
-                current_take_color = color_str
+        direction_style = next((style for style, cb in self._dir_cbs.items() if cb.isChecked()), "none")
         
         return {
             "naming_convention": {
@@ -3669,30 +3754,40 @@ class TakeHandlerSettings(QDialog):
                 "direction_style": direction_style
             },
             "accessibility": {
-                "current_take_color": current_take_color
+                "current_take_color": self._current_take_color
             }
         }
     
-    def settings_have_changed(self):
+    def settings_have_changed(self, saved=None, current=None):
         """Check if settings have changed from what's saved"""
-        current = self.get_current_settings()
-        saved = load_global_settings()
-        return current != saved
-    
-    def naming_convention_changed(self):
+        if current is None:
+            current = self.get_current_settings()
+        if saved is None:
+            saved = load_global_settings()
+        # Compare section by section (stops at the first difference); only the sections this
+        # dialog owns are considered, so unrelated keys in the shared file don't count
+        return any(section != saved.get(key) for key, section in current.items())
+    
+    def naming_convention_changed(self, saved=None, current=None):
         """Check if only naming convention settings have changed"""
-        current = self.get_current_settings()
-        saved = load_global_settings()
+        if current is None:
+            current = self.get_current_settings()
+        if saved is None:
+            saved = load_global_settings()
         return current.get("naming_convention") != saved.get("naming_convention")
     
     def apply_settings(self):
         """Apply the settings"""
-        if not self.settings_have_changed():
+        # Read the saved file and the dialog state once for all comparisons below
+        saved = load_global_settings()
+        new_settings = self.get_current_settings()
+        
+        if not self.settings_have_changed(saved, new_settings):
             self.accept()
             return
         
         # Check if naming convention changed - only show prompt for naming convention
-        if self.naming_convention_changed():
+        if self.naming_convention_changed(saved, new_settings):
             # Show application choice dialog for naming convention
             choice_dialog = QMessageBox(self)
             choice_dialog.setWindowTitle("Apply Settings")
@@ -3712,42 +3807,38 @@ class TakeHandlerSettings(QDialog):
                 return
             
             # Save the new settings
-            new_settings = self.get_current_settings()
             save_global_settings(new_settings)
             
             if clicked_button == retroactive_btn:
-                self.apply_retroactively()
+                self.apply_retroactively(new_settings)
         else:
             # Only non-naming convention settings changed, apply immediately
-            new_settings = self.get_current_settings()
             save_global_settings(new_settings)
         
         self.accept()
     
-    def apply_retroactively(self):
+    def apply_retroactively(self, current_settings=None):
         """Apply naming convention to all existing takes"""
         try:
             system = FBSystem()
             renamed_takes = []
-            current_settings = self.get_current_settings()
+            if current_settings is None:
+                current_settings = self.get_current_settings()
+            
+            # Snapshot the scene takes once; renaming doesn't change membership or order
+            takes = list(system.Scene.Takes)
             
             # Go through all takes and check if they need renaming
-            for take in system.Scene.Takes:
+            for take in takes:
                 original_name = take.Name
-                # Remove numerical prefix for processing
-                clean_name = strip_prefix(original_name)
-                new_name = apply_naming_convention(clean_name, current_settings)
-                
-                # Add back the prefix if it existed
-                if original_name != clean_name:
-                    prefix = original_name[:len(original_name) - len(clean_name)]
-                    new_name = prefix + new_name
+                # Process the name without its numerical prefix, then add the prefix back (may be empty)
+                prefix, clean_name = split_prefix(original_name)
+                new_name = prefix + apply_naming_convention(clean_name, current_settings)
                 
                 if original_name != new_name:
-                    # Apply naming convention to the new name
-                    processed_name = apply_naming_convention(new_name)
-                    take.Name = processed_name
-                    renamed_takes.append((original_name, processed_name))
+                    # new_name is already converted; a second pass would also mangle the prefix
+                    take.Name = new_name
+                    renamed_takes.append((original_name, new_name))
             
             # Show results if any takes were renamed
             if renamed_takes:
@@ -3759,37 +3850,13 @@ class TakeHandlerSettings(QDialog):
             QMessageBox.critical(self, "Error", f"Failed to apply naming convention: {str(e)}")
     
     def show_rename_results(self, renamed_takes):
-        """Show a dialog with all the renamed takes"""
-        results_dialog = QDialog(self)
-        results_dialog.setWindowTitle("Takes Renamed")
-        results_dialog.setMinimumSize(500, 300)
-        
-        layout = QVBoxLayout(results_dialog)
-        
-        label = QLabel(f"Renamed {len(renamed_takes)} takes:")
-        layout.addWidget(label)
-        
-        # Create text widget to show all changes
-        text_widget = QTextEdit()
-        text_widget.setReadOnly(True)
-        
-        text_content = ""
-        for old_name, new_name in renamed_takes:
-            text_content += f"{old_name} → {new_name}\n"
-        
-        text_widget.setPlainText(text_content)
-        layout.addWidget(text_widget)
-        
-        # OK button
-        ok_button = QPushButton("OK")
-        ok_button.clicked.connect(results_dialog.accept)
-        button_layout = QHBoxLayout()
-        button_layout.addStretch()
-        button_layout.addWidget(ok_button)
-        button_layout.addStretch()
-        layout.addLayout(button_layout)
-        
-        results_dialog.exec_()
+        """Show a message box listing all the renamed takes"""
+        results_box = QMessageBox(self)
+        results_box.setWindowTitle("Takes Renamed")
+        results_box.setIcon(QMessageBox.Information)
+        results_box.setText(f"Renamed {len(renamed_takes)} takes.")
+        results_box.setDetailedText("\n".join(f"{old_name} → {new_name}" for old_name, new_name in renamed_takes))
+        results_box.exec_()
 
 
 # Global reference
@@ -4,8 +4,30 @@ import PySide6
 from PySide6 import QtWidgets, QtCore, QtGui
 import sys
 import re
+import functools
+import collections
+import contextlib
 import json
 import os
+import logging
+import time
+import hashlib
+
+# Debug output is off by default; set TAKE_RENAMER_DEBUG=1 to trace undo/redo
+log = logging.getLogger("take_renamer")
+_DEBUG = os.environ.get("TAKE_RENAMER_DEBUG") == "1"
+if _DEBUG and not log.handlers:
+    log.addHandler(logging.StreamHandler(sys.stdout))
+    log.setLevel(logging.DEBUG)
+
+def _find_titled_main_window(top_level_windows):
+    """Return the top-level window titled MotionBuilder, or None if there is no such window"""
+    for w in top_level_windows:
+        if (hasattr(w, 'windowTitle') and 
+            'MotionBuilder' in w.windowTitle() and
+            w.parentWidget() is None):
+            return w
+    return None
 
 def get_motionbuilder_main_window():
     """Find the main MotionBuilder window/QWidget."""
@@ -14,11 +36,9 @@ def get_motionbuilder_main_window():
     top_level_windows = QApplication.topLevelWidgets()
     
     # Look for the MotionBuilder main window
-    for w in top_level_windows:
-        if (hasattr(w, 'windowTitle') and 
-            'MotionBuilder' in w.windowTitle() and
-            w.parentWidget() is None):
-            return w
+    main_window = _find_titled_main_window(top_level_windows)
+    if main_window is not None:
+        return main_window
     
     # Fallback: find the largest top-level window
     if top_level_windows:
@@ -28,33 +48,180 @@ def get_motionbuilder_main_window():
     
     return None
 
+# The MotionBuilder main window lives for the whole session, so it is only looked up once
+_mb_main_window = None
+
+def _get_mb_window():
+    """Return the MotionBuilder main window, scanning the top-level widgets only on first use"""
+    global _mb_main_window
+    if _mb_main_window is None:
+        from PySide6.QtWidgets import QApplication
+        _mb_main_window = _find_titled_main_window(QApplication.topLevelWidgets())
+        if _mb_main_window is None:
+            # Don't cache the largest-widget fallback, it may be a temporary dialog
+            return get_motionbuilder_main_window()
+    return _mb_main_window
+
+@functools.lru_cache(maxsize=64)
+def _compile_pattern(pattern, flags):
+    """Compile a find pattern, reusing it across repeated Preview/Replace clicks"""
+    return re.compile(pattern, flags)
+
+def _ci_replace(s, find, repl):
+    """Case-insensitive literal replace without going through the regex engine"""
+    f = find.lower()
+    if not f:
+        return s
+    lo = s.lower()
+    if len(lo) != len(s):
+        # Lowercasing changed the length (rare Unicode case), indices would not line up
+        return re.sub(re.escape(find), lambda m: repl, s, flags=re.IGNORECASE)
+    
+    out = []
+    i = 0
+    flen = len(f)
+    while True:
+        j = lo.find(f, i)
+        if j < 0:
+            out.append(s[i:])
+            break
+        out.append(s[i:j])
+        out.append(repl)
+        i = j + flen
+    return "".join(out)
+
+@functools.lru_cache(maxsize=8192)
+def _apply_transform(name, find_text, replace_text, use_regex, case_sensitive):
+    """Find/replace a single take name; cached since Preview and Replace run over the same names"""
+    if use_regex:
+        pattern = _compile_pattern(find_text, 0 if case_sensitive else re.IGNORECASE)
+        return pattern.sub(replace_text, name)
+    if case_sensitive:
+        return name.replace(find_text, replace_text)
+    return _ci_replace(name, find_text, replace_text)
+
+def _build_replacer(find_text, replace_text, use_regex, case_sensitive):
+    """Return a function mapping a take name to its find/replace result (raises re.error for bad patterns)"""
+    if use_regex:
+        # Compile up front so a bad pattern is reported before any take is touched
+        _compile_pattern(find_text, 0 if case_sensitive else re.IGNORECASE)
+    return lambda name: _apply_transform(name, find_text, replace_text, use_regex, case_sensitive)
+
+# Help dialog contents (static, so the dialog only parses it once)
+_HELP_HTML = """
+<h2>Take Renamer Help</h2>
+
+<h3>Basic Usage</h3>
+<p>Select one or more takes from the list, then use one of the renaming methods in the tabs below.</p>
+
+<h3>Renaming Options</h3>
+<ul>
+    <li><b>Simple Rename</b>: Change the name of the selected takes.</li>
+    <li><b>Find and Replace</b>: Find text in take names and replace it.</li>
+    <li><b>Prefix/Suffix</b>: Add text before or after the take names.</li>
+</ul>
+
+<h3>Preview</h3>
+<p>Click the Preview button to see how the changes will look before applying them.</p>
+
+<h3>Undo/Redo</h3>
+<p>Use the Undo and Redo buttons to revert or restore changes.</p>
+
+<h3>Keyboard Shortcuts</h3>
+<ul>
+    <li><b>Ctrl+Z</b>: Undo</li>
+    <li><b>Ctrl+Y</b>: Redo</li>
+    <li><b>F5</b>: Refresh</li>
+    <li><b>Ctrl+F</b>: Focus filter</li>
+</ul>
+"""
+
+# Undo history limits; override via "history_config" in the settings file
+DEFAULT_HISTORY_CONFIG = {
+    "max_depth": 200,
+    "max_bytes": 16 << 20
+}
+
+# Renames of the same takes within this many seconds share one undo step
+HISTORY_MERGE_WINDOW = 0.5
+
+# Upper bound (in name characters) for the undo history persisted per scene
+HISTORY_FILE_MAX_BYTES = 4 << 20
+
+class HistoryEntry(object):
+    """One undoable rename batch, stored as (take index, old name, new name) per changed take"""
+    __slots__ = ("changes", "cost")
+    
+    def __init__(self, changes):
+        self.changes = changes
+        # Approximate memory held by the entry, counted in name characters
+        self.cost = sum(len(old_name) + len(new_name) for _, old_name, new_name in changes)
+    
+    def inverted(self):
+        """Return the entry that reverses this one"""
+        return HistoryEntry([(i, new_name, old_name) for i, old_name, new_name in self.changes])
+
 class TakeRenamerUI(QtWidgets.QDialog):
+    # Shortcut keys, resolved once instead of on every key press
+    _UNDO_SEQ = QtGui.QKeySequence.Undo
+    _REDO_SEQ = QtGui.QKeySequence.Redo
+    _FIND_SEQ = QtGui.QKeySequence.Find
+    _KEY_F5 = QtCore.Qt.Key_F5
+    _KEY_Z = QtCore.Qt.Key_Z
+    _CTRL = QtCore.Qt.ControlModifier
+    
     def __init__(self, parent=None):
         # If no parent provided, try to get MotionBuilder main window
         if parent is None:
-            parent = get_motionbuilder_main_window()
+            parent = _get_mb_window()
             
         super(TakeRenamerUI, self).__init__(parent)
         
+        # Debounce settings writes so dragging the window edge doesn't hit disk per resize event
+        self._settings_timer = QtCore.QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(1000)
+        self._settings_timer.timeout.connect(self._flush_settings)
+        
         self.setWindowTitle("Take Renamer")
         self.setMinimumWidth(500)
         self.setMinimumHeight(600)
         
-        # Initialize history for undo/redo
-        self.history = []
-        self.history_index = -1
-        self.max_history = 20
+        # Undo/redo stacks of HistoryEntry deltas, bounded by depth and total size
+        self.history_config = dict(DEFAULT_HISTORY_CONFIG)
+        self.undo_stack = collections.deque(maxlen=self.history_config["max_depth"])
+        self.redo_stack = collections.deque(maxlen=self.history_config["max_depth"])
+        self.history_bytes = 0
+        self._last_push_time = 0.0
+        
+        # Last enabled state pushed to the undo/redo buttons (both start disabled)
+        self._undo_enabled_cache = False
+        self._redo_enabled_cache = False
+        
+        # FBSystem is a singleton, but each FBSystem() call still goes through the bindings
+        self._fb_system = FBSystem()
+        
+        # Help dialog, created on first use
+        self._help_dialog = None
+        self._help_history_label = None
+        
+        # History file of the scene this session's undo history belongs to, set once settings load
+        self._history_path = None
+        
+        # Takes by list row, used to build tooltips on demand
+        self._list_takes = []
+        self._visible_count = 0
         
         # Settings
         self.settings_file = os.path.join(os.path.expanduser("~"), "motionbuilder_take_renamer_settings.json")
-        self.settings = self.load_settings()
+        # Start empty and read the file once the event loop is running, so a slow
+        # (e.g. network) home directory doesn't delay the dialog's first paint
+        self.settings = {}
+        QtCore.QTimer.singleShot(0, self._load_settings_deferred)
         
         try:
             self.create_ui()
             self.populate_takes()
-            
-            # Save initial state for undo/redo
-            self.capture_initial_state()
         except Exception as e:
             print(f"Error initializing UI: {str(e)}")
             import traceback
@@ -79,9 +246,22 @@ class TakeRenamerUI(QtWidgets.QDialog):
         filter_label = QtWidgets.QLabel("Filter:")
         self.filter_input = QtWidgets.QLineEdit()
         self.filter_input.setPlaceholderText("Type to filter takes...")
-        self.filter_input.textChanged.connect(self.filter_takes)
+        
+        # Debounce filtering so rapid typing only filters once
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.filter_takes)
+        self.filter_input.textChanged.connect(lambda: self._filter_timer.start())
+        
+        # Prefix matching rejects most names on the first character, useful for huge scenes
+        self.starts_with_cb = QtWidgets.QCheckBox("Prefix only")
+        self.starts_with_cb.setToolTip("Only show takes whose name starts with the filter text")
+        self.starts_with_cb.toggled.connect(self.filter_takes)
+        
         filter_layout.addWidget(filter_label)
         filter_layout.addWidget(self.filter_input)
+        filter_layout.addWidget(self.starts_with_cb)
         top_layout.addLayout(filter_layout)
         
         # Takes label
@@ -92,7 +272,10 @@ class TakeRenamerUI(QtWidgets.QDialog):
         self.takes_list = QtWidgets.QListWidget()
         self.takes_list.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         self.takes_list.setAlternatingRowColors(True)
+        # Every row is a single line of text, so let the view skip per-item size queries
+        self.takes_list.setUniformItemSizes(True)
         self.takes_list.itemSelectionChanged.connect(self.update_selection_info)
+        self.takes_list.viewport().installEventFilter(self)
         top_layout.addWidget(self.takes_list)
         
         # Selection info layout
@@ -315,73 +498,150 @@ class TakeRenamerUI(QtWidgets.QDialog):
     
     def get_selected_takes(self):
         """Get the selected takes from the list"""
-        selected_takes = []
-        system = FBSystem()
-        scene = system.Scene
-        
-        # Get selected takes from list widget
-        selected_items = self.takes_list.selectedItems()
-        if not selected_items:
+        # Get the names of the selected takes as a set for O(1) membership tests
+        selected_names = {item.text() for item in self.takes_list.selectedItems()}
+        if not selected_names:
             return []
         
-        # Get the names of the selected takes
-        selected_names = [item.text() for item in selected_items]
-        
-        # Iterate through all takes and find those with matching names
-        take_count = len(scene.Takes)
-        for i in range(take_count):
-            take = scene.Takes[i]
-            if take.Name in selected_names:
-                selected_takes.append(take)
-        
-        return selected_takes
+        # Single pass over the scene; names can repeat, so every matching take is kept
+        return [take for take in self._all_takes() if take.Name in selected_names]
+    
+    def _all_takes(self):
+        """Return the scene's take list, resolved once per call site and iterated directly"""
+        return self._fb_system.Scene.Takes
+    
+    def _snapshot_take_names(self):
+        """Read all take names from the scene in a single pass, as a tuple in scene order"""
+        return tuple(take.Name for take in self._all_takes())
     
     def populate_takes(self):
         """Populate the list widget with all takes in the scene"""
-        self.takes_list.clear()
-        
-        # Get the FBSystem
-        system = FBSystem()
-        scene = system.Scene
-        
-        # Get all takes in the scene
-        take_count = len(scene.Takes)
-        for i in range(take_count):
-            take = scene.Takes[i]
-            
-            # Get additional metadata for tooltip
-            duration = take.LocalTimeSpan.GetStop().GetSecondDouble() - take.LocalTimeSpan.GetStart().GetSecondDouble()
-            
-            item = QtWidgets.QListWidgetItem(take.Name)
-            item.setData(QtCore.Qt.UserRole, take.Name)  # Store original name
-            
-            # Add tool tip with additional information
-            tooltip = f"Name: {take.Name}\nDuration: {duration:.2f} seconds"
-            item.setToolTip(tooltip)
-            
-            self.takes_list.addItem(item)
+        # Get all takes in the scene; durations are only read when a tooltip is shown
+        self._list_takes = list(self._all_takes())
+        self._rebuild_list(tuple(take.Name for take in self._list_takes))
         
-        # Filter takes based on filter text
-        filter_text = self.filter_input.text().lower()
-        if filter_text:
-            for i in range(self.takes_list.count()-1, -1, -1):
-                item = self.takes_list.item(i)
-                if filter_text not in item.text().lower():
-                    self.takes_list.takeItem(i)
+        # Re-apply the current filter to the new rows
+        self.filter_takes()
+    
+    def _rebuild_list(self, names):
+        """Recreate every row of the list widget from a sequence of take names"""
+        takes_list = self.takes_list
         
-        # Update selection info
-        self.update_selection_info()
+        # Suspend repaints and selection signals while the rows are recreated
+        takes_list.setUpdatesEnabled(False)
+        takes_list.blockSignals(True)
+        try:
+            takes_list.clear()
+            takes_list.addItems(list(names))
+        finally:
+            takes_list.blockSignals(False)
+            takes_list.setUpdatesEnabled(True)
+    
+    def _refresh_from_snapshot(self, state):
+        """Bring the list widget in line with a take-name snapshot without walking the scene again"""
+        takes_list = self.takes_list
+        
+        if takes_list.count() != len(state):
+            # Takes were added or removed behind our back, start over (tooltips need the new takes too)
+            self._list_takes = list(self._all_takes())
+            self._rebuild_list(state)
+        else:
+            # Same takes in the same rows, so only retext the rows whose name changed
+            takes_list.setUpdatesEnabled(False)
+            try:
+                for i, name in enumerate(state):
+                    item = takes_list.item(i)
+                    if item.text() != name:
+                        item.setText(name)
+            finally:
+                takes_list.setUpdatesEnabled(True)
+        
+        # Renamed rows may now match (or stop matching) the filter
+        self.filter_takes()
+    
+    def eventFilter(self, obj, event):
+        """Build take tooltips on hover instead of for every row up front"""
+        if event.type() == QtCore.QEvent.ToolTip and obj == self.takes_list.viewport():
+            item = self.takes_list.itemAt(event.pos())
+            row = self.takes_list.row(item) if item else -1
+            if 0 <= row < len(self._list_takes):
+                try:
+                    span = self._list_takes[row].LocalTimeSpan
+                    duration = span.GetStop().GetSecondDouble() - span.GetStart().GetSecondDouble()
+                    tooltip = f"Name: {item.text()}\nDuration: {duration:.2f} seconds"
+                    QtWidgets.QToolTip.showText(event.globalPos(), tooltip, obj)
+                except Exception:
+                    # Take was removed from the scene since the last refresh
+                    QtWidgets.QToolTip.hideText()
+            else:
+                QtWidgets.QToolTip.hideText()
+            return True
+        return super(TakeRenamerUI, self).eventFilter(obj, event)
     
     def filter_takes(self):
-        """Filter takes based on filter text"""
-        self.populate_takes()
+        """Filter takes based on filter text by hiding rows in place"""
+        filter_text = self.filter_input.text()
+        takes_list = self.takes_list
+        count = takes_list.count()
+        
+        # Let Qt do the case-insensitive substring matching in C++; keep the
+        # matched wrappers alive so item(i) hands back the same objects
+        match_flag = QtCore.Qt.MatchStartsWith if self.starts_with_cb.isChecked() else QtCore.Qt.MatchContains
+        matched = takes_list.findItems(filter_text, match_flag) if filter_text else None
+        matched_ids = {id(item) for item in matched} if matched is not None else None
+        
+        takes_list.setUpdatesEnabled(False)
+        takes_list.blockSignals(True)
+        try:
+            for i in range(count):
+                item = takes_list.item(i)
+                hidden = matched_ids is not None and id(item) not in matched_ids
+                # Only touch rows whose visibility actually changes
+                if item.isHidden() != hidden:
+                    item.setHidden(hidden)
+                if hidden and item.isSelected():
+                    # Hidden rows must not take part in rename operations
+                    item.setSelected(False)
+        finally:
+            takes_list.blockSignals(False)
+            takes_list.setUpdatesEnabled(True)
+        
+        self._visible_count = len(matched) if matched is not None else count
+        self.update_selection_info()
     
     def update_selection_info(self):
         """Update the selection info label"""
         selected_count = len(self.takes_list.selectedItems())
-        total_count = self.takes_list.count()
+        total_count = self._visible_count
         self.selection_info.setText(f"{selected_count} of {total_count} takes selected")
     
+    @contextlib.contextmanager
+    def _mutation(self, label):
+        """Record undo history and refresh the list around a batch of take renames"""
+        # Names before making changes
+        old_state = self._snapshot_take_names()
+        
+        try:
+            yield
+        finally:
+            # Record whatever was renamed, even if the batch stopped part way
+            new_state = self._snapshot_take_names()
+            self._refresh_from_snapshot(new_state)
+            
+            # Only the takes whose name changed go into the history entry
+            changes = []
+            if len(new_state) == len(old_state):
+                changes = [(i, old_name, new_name)
+                           for i, (old_name, new_name) in enumerate(zip(old_state, new_state))
+                           if old_name != new_name]
+            if changes:
+                self._clear_redo()
+                self._record_history(HistoryEntry(changes))
+                if _DEBUG:
+                    log.debug("Added %s entry to history (%d take(s) changed)", label, len(changes))
+            
+            self.update_undo_redo_buttons()
+    
     def rename_takes(self):
         """Rename the selected takes with the new name"""
         new_name = self.rename_input.text().strip()
@@ -394,48 +654,22 @@ class TakeRenamerUI(QtWidgets.QDialog):
             QtWidgets.QMessageBox.warning(self, "Warning", "No takes selected.")
             return
         
-        # Ensure we have an initial state
-        if len(self.history) == 0:
-            self.capture_initial_state()
-        
-        # Save current state for undo before making changes
-        self.save_state()
-        
-        # If only one take is selected, rename it directly
-        if len(takes) == 1 and not self.use_numbering.isChecked():
-            takes[0].Name = new_name
-        # If multiple takes are selected, add numbering
-        else:
-            start_num = self.start_number.value()
-            padding = self.padding_digits.value()
-            separator = self.number_separator.text()
-            
-            for i, take in enumerate(takes):
-                num = i + start_num
-                if self.use_numbering.isChecked():
-                    take.Name = f"{new_name}{separator}{str(num).zfill(padding)}"
-                else:
+        with self._mutation("rename"):
+            # Add numbering if requested, otherwise every selected take gets the plain name
+            if self.use_numbering.isChecked():
+                for take, numbered_name in zip(takes, self._numbered_names(new_name, len(takes))):
+                    take.Name = numbered_name
+            else:
+                for take in takes:
                     take.Name = new_name
-        
-        # Refresh the list
-        self.populate_takes()
-        
-        # Save the new state
-        new_state = {}
-        system = FBSystem()
-        scene = system.Scene
-        take_count = len(scene.Takes)
-        for i in range(take_count):
-            take = scene.Takes[i]
-            new_state[i] = take.Name
-            
-        # Add the new state to history (only if different from last state)
-        if len(self.history) == 0 or new_state != self.history[-1]:
-            self.history.append(new_state)
-            self.history_index = len(self.history) - 1
-            print(f"Added rename state to history. Now at index {self.history_index} of {len(self.history)-1}")
-        
-        self.update_undo_redo_buttons()
+    
+    def _numbered_names(self, new_name, count):
+        """Build the numbered names for a simple rename of count takes"""
+        start_num = self.start_number.value()
+        # Bake name, separator and padding into one template (braces in the name escaped)
+        base_name = (new_name + self.number_separator.text()).replace("{", "{{").replace("}", "}}")
+        template = f"{base_name}{{:0{self.padding_digits.value()}d}}"
+        return list(map(template.format, range(start_num, start_num + count)))
     
     def find_and_replace(self):
         """Find and replace text in the selected take names"""
@@ -444,12 +678,7 @@ class TakeRenamerUI(QtWidgets.QDialog):
         
         # Determine which takes to process
         if self.search_all_takes.isChecked():
-            system = FBSystem()
-            scene = system.Scene
-            takes = []
-            take_count = len(scene.Takes)
-            for i in range(take_count):
-                takes.append(scene.Takes[i])
+            takes = list(self._all_takes())
         else:
             takes = self.get_selected_takes()
             
@@ -457,94 +686,41 @@ class TakeRenamerUI(QtWidgets.QDialog):
             QtWidgets.QMessageBox.warning(self, "Warning", "No takes selected.")
             return
         
-        # Ensure we have an initial state
-        if len(self.history) == 0:
-            self.capture_initial_state()
-        
-        # Save current state for undo
-        self.save_state()
-        
-        use_regex = self.use_regex.isChecked()
-        case_sensitive = self.case_sensitive.isChecked()
-        
-        for take in takes:
-            if use_regex:
-                try:
-                    if case_sensitive:
-                        new_name = re.sub(find_text, replace_text, take.Name)
-                    else:
-                        new_name = re.sub(find_text, replace_text, take.Name, flags=re.IGNORECASE)
-                except re.error as e:
-                    QtWidgets.QMessageBox.warning(self, "RegEx Error", f"Invalid regular expression: {str(e)}")
-                    return
-            else:
-                if case_sensitive:
-                    new_name = take.Name.replace(find_text, replace_text)
-                else:
-                    new_name = re.sub(re.escape(find_text), replace_text, take.Name, flags=re.IGNORECASE)
-            
-            take.Name = new_name
-        
-        # Refresh the list
-        self.populate_takes()
-        
-        # Save the new state
-        new_state = {}
-        system = FBSystem()
-        scene = system.Scene
-        take_count = len(scene.Takes)
-        for i in range(take_count):
-            take = scene.Takes[i]
-            new_state[i] = take.Name
-            
-        # Add the new state to history (only if different from last state)
-        if len(self.history) == 0 or new_state != self.history[-1]:
-            self.history.append(new_state)
-            self.history_index = len(self.history) - 1
-            print(f"Added find/replace state to history. Now at index {self.history_index} of {len(self.history)-1}")
+        # Compile the pattern once up front instead of once per take
+        try:
+            replacer = _build_replacer(find_text, replace_text, self.use_regex.isChecked(), self.case_sensitive.isChecked())
+        except re.error as e:
+            QtWidgets.QMessageBox.warning(self, "RegEx Error", f"Invalid regular expression: {str(e)}")
+            return
         
-        self.update_undo_redo_buttons()
+        try:
+            with self._mutation("find/replace"):
+                for take in takes:
+                    old_name = take.Name
+                    new_name = replacer(old_name)
+                    if new_name != old_name:
+                        take.Name = new_name
+        except re.error as e:
+            # Bad group references in the replacement only surface on substitution
+            QtWidgets.QMessageBox.warning(self, "RegEx Error", f"Invalid regular expression: {str(e)}")
     
     def add_affix(self):
         """Add prefix and/or suffix to the selected take names"""
         prefix = self.prefix_input.text()
         suffix = self.suffix_input.text()
+        if not prefix and not suffix:
+            QtWidgets.QMessageBox.warning(self, "Warning", "Please enter a prefix or suffix.")
+            return
         
         takes = self.get_selected_takes()
         if not takes:
             QtWidgets.QMessageBox.warning(self, "Warning", "No takes selected.")
             return
         
-        # Ensure we have an initial state
-        if len(self.history) == 0:
-            self.capture_initial_state()
-        
-        # Save current state for undo
-        self.save_state()
-        
-        for take in takes:
-            new_name = prefix + take.Name + suffix
-            take.Name = new_name
-        
-        # Refresh the list
-        self.populate_takes()
-        
-        # Save the new state
-        new_state = {}
-        system = FBSystem()
-        scene = system.Scene
-        take_count = len(scene.Takes)
-        for i in range(take_count):
-            take = scene.Takes[i]
-            new_state[i] = take.Name
-            
-        # Add the new state to history (only if different from last state)
-        if len(self.history) == 0 or new_state != self.history[-1]:
-            self.history.append(new_state)
-            self.history_index = len(self.history) - 1
-            print(f"Added affix state to history. Now at index {self.history_index} of {len(self.history)-1}")
-        
-        self.update_undo_redo_buttons()
+        with self._mutation("affix"):
+            for take in takes:
+                new_name = prefix + take.Name + suffix
+                take.Name = new_name
     
     def capitalize_words(self):
         """Capitalize the first letter of each word in the selected take names"""
@@ -553,48 +729,20 @@ class TakeRenamerUI(QtWidgets.QDialog):
             QtWidgets.QMessageBox.warning(self, "Warning", "No takes selected.")
             return
         
-        # Ensure we have an initial state
-        if len(self.history) == 0:
-            self.capture_initial_state()
-        
-        # Save current state for undo
-        self.save_state()
-        
-        for take in takes:
-            # Title case splits words and capitalizes the first letter of each word
-            new_name = take.Name.title()
-            take.Name = new_name
-        
-        # Refresh the list
-        self.populate_takes()
-        
-        # Save the new state
-        new_state = {}
-        system = FBSystem()
-        scene = system.Scene
-        take_count = len(scene.Takes)
-        for i in range(take_count):
-            take = scene.Takes[i]
-            new_state[i] = take.Name
-            
-        # Add the new state to history (only if different from last state)
-        if len(self.history) == 0 or new_state != self.history[-1]:
-            self.history.append(new_state)
-            self.history_index = len(self.history) - 1
-            print(f"Added capitalize state to history. Now at index {self.history_index} of {len(self.history)-1}")
-        
-        self.update_undo_redo_buttons()
+        with self._mutation("capitalize"):
+            for take in takes:
+                # Title case splits words and capitalizes the first letter of each word
+                old_name = take.Name
+                new_name = old_name.title()
+                # Skip names that are already title case to avoid needless SDK writes
+                if new_name != old_name:
+                    take.Name = new_name
     
     def preview_rename(self, operation_type):
         """Preview renaming operations without applying them"""
         # Determine which takes to process
         if operation_type == "replace" and self.search_all_takes.isChecked():
-            system = FBSystem()
-            scene = system.Scene
-            takes = []
-            take_count = len(scene.Takes)
-            for i in range(take_count):
-                takes.append(scene.Takes[i])
+            takes = list(self._all_takes())
         else:
             takes = self.get_selected_takes()
             
@@ -605,8 +753,8 @@ class TakeRenamerUI(QtWidgets.QDialog):
         # Clear previous preview
         self.preview_list.setRowCount(0)
         
-        # Generate preview based on operation type
-        preview_takes = []
+        # Generate preview based on operation type; original names are read from the SDK once
+        preview_originals = []
         preview_names = []
         
         if operation_type == "simple":
@@ -615,204 +763,218 @@ class TakeRenamerUI(QtWidgets.QDialog):
                 QtWidgets.QMessageBox.warning(self, "Warning", "Please enter a new name.")
                 return
             
-            if len(takes) == 1 and not self.use_numbering.isChecked():
-                preview_takes = takes
-                preview_names = [new_name]
+            preview_originals = [take.Name for take in takes]
+            if self.use_numbering.isChecked():
+                preview_names = self._numbered_names(new_name, len(takes))
             else:
-                start_num = self.start_number.value()
-                padding = self.padding_digits.value()
-                separator = self.number_separator.text()
-                
-                preview_takes = takes
-                for i in range(len(takes)):
-                    num = i + start_num
-                    if self.use_numbering.isChecked():
-                        preview_names.append(f"{new_name}{separator}{str(num).zfill(padding)}")
-                    else:
-                        preview_names.append(new_name)
+                preview_names = [new_name] * len(takes)
         
         elif operation_type == "replace":
             find_text = self.find_input.text()
             replace_text = self.replace_input.text()
-            use_regex = self.use_regex.isChecked()
-            case_sensitive = self.case_sensitive.isChecked()
             
-            for take in takes:
-                if use_regex:
-                    try:
-                        if case_sensitive:
-                            new_name = re.sub(find_text, replace_text, take.Name)
-                        else:
-                            new_name = re.sub(find_text, replace_text, take.Name, flags=re.IGNORECASE)
-                    except re.error as e:
-                        QtWidgets.QMessageBox.warning(self, "RegEx Error", f"Invalid regular expression: {str(e)}")
-                        return
-                else:
-                    if case_sensitive:
-                        new_name = take.Name.replace(find_text, replace_text)
-                    else:
-                        new_name = re.sub(re.escape(find_text), replace_text, take.Name, flags=re.IGNORECASE)
-                
-                # Only add to preview if the name would actually change
-                if new_name != take.Name:
-                    preview_takes.append(take)
-                    preview_names.append(new_name)
+            try:
+                replacer = _build_replacer(find_text, replace_text, self.use_regex.isChecked(), self.case_sensitive.isChecked())
+                for take in takes:
+                    old_name = take.Name
+                    new_name = replacer(old_name)
+                    
+                    # Only add to preview if the name would actually change
+                    if new_name != old_name:
+                        preview_originals.append(old_name)
+                        preview_names.append(new_name)
+            except re.error as e:
+                QtWidgets.QMessageBox.warning(self, "RegEx Error", f"Invalid regular expression: {str(e)}")
+                return
         
         elif operation_type == "affix":
             prefix = self.prefix_input.text()
             suffix = self.suffix_input.text()
             
-            for take in takes:
-                new_name = prefix + take.Name + suffix
-                # Only add to preview if something would be added
-                if prefix or suffix:
-                    preview_takes.append(take)
-                    preview_names.append(new_name)
+            # Only add to preview if something would be added
+            if prefix or suffix:
+                preview_originals = [take.Name for take in takes]
+                preview_names = [prefix + name + suffix for name in preview_originals]
         
         # Show message if no changes would be made
-        if not preview_takes:
+        if not preview_originals:
             self.preview_list.setRowCount(1)
             self.preview_list.setItem(0, 0, QtWidgets.QTableWidgetItem("No changes"))
             self.preview_list.setItem(0, 1, QtWidgets.QTableWidgetItem("No takes would be modified"))
             return
             
-        # Populate preview list
-        self.preview_list.setRowCount(len(preview_takes))
-        for i, (take, new_name) in enumerate(zip(preview_takes, preview_names)):
-            # Original name
-            self.preview_list.setItem(i, 0, QtWidgets.QTableWidgetItem(take.Name))
-            
-            # New name
-            self.preview_list.setItem(i, 1, QtWidgets.QTableWidgetItem(new_name))
+        # Populate preview list with repaints and item signals suspended
+        preview_list = self.preview_list
+        preview_list.setUpdatesEnabled(False)
+        preview_list.blockSignals(True)
+        try:
+            preview_list.setRowCount(len(preview_originals))
+            for i, (original_name, new_name) in enumerate(zip(preview_originals, preview_names)):
+                # Original name
+                preview_list.setItem(i, 0, QtWidgets.QTableWidgetItem(original_name))
+                
+                # New name
+                preview_list.setItem(i, 1, QtWidgets.QTableWidgetItem(new_name))
+        finally:
+            preview_list.blockSignals(False)
+            preview_list.setUpdatesEnabled(True)
     
-    def capture_initial_state(self):
-        """Capture the initial state of all takes for undo/redo"""
-        system = FBSystem()
-        scene = system.Scene
-        
-        initial_state = {}
-        take_count = len(scene.Takes)
-        for i in range(take_count):
-            take = scene.Takes[i]
-            initial_state[i] = take.Name
-        
-        # Reset history
-        self.history = [initial_state]
-        self.history_index = 0
-        
-        print(f"Initial state captured. History index: {self.history_index}, History size: {len(self.history)}")
-        self.update_undo_redo_buttons()
+    def _push_history(self, stack, entry):
+        """Push an entry onto the undo or redo stack, keeping history within its budget"""
+        if len(stack) == stack.maxlen:
+            # The deque is about to drop its oldest entry
+            self.history_bytes -= stack[0].cost
+        stack.append(entry)
+        self.history_bytes += entry.cost
+        self._trim_history()
     
-    def save_state(self):
-        """Save current take names for undo/redo"""
-        system = FBSystem()
-        scene = system.Scene
-        
-        # Create new state
-        current_state = {}
-        take_count = len(scene.Takes)
-        for i in range(take_count):
-            take = scene.Takes[i]
-            current_state[i] = take.Name
-        
-        # If we're in the middle of the history, truncate it
-        if self.history_index < len(self.history) - 1:
-            print(f"Truncating history from {len(self.history)} to {self.history_index + 1}")
-            self.history = self.history[:self.history_index + 1]
-        
-        # Check if the new state is different from the current state
-        if self.history_index >= 0 and self.history[self.history_index] == current_state:
-            print("State unchanged, not adding to history")
-            return
-        
-        # Add new state to history
-        self.history.append(current_state)
-        self.history_index = len(self.history) - 1
-        
-        # Limit history size
-        if len(self.history) > self.max_history:
-            self.history.pop(0)
-            self.history_index -= 1
-        
-        print(f"Saved new state. History index: {self.history_index}, History size: {len(self.history)}")
+    def _record_history(self, entry):
+        """Push a new rename entry, merging it into the previous one if it quickly follows on the same takes"""
+        now = time.monotonic()
+        top = self.undo_stack[-1] if self.undo_stack else None
+        if (top is not None and now - self._last_push_time < HISTORY_MERGE_WINDOW and
+                {i for i, _, _ in top.changes} == {i for i, _, _ in entry.changes}):
+            # Keep the original names from the earlier entry and the latest new names
+            new_names = {i: new_name for i, _, new_name in entry.changes}
+            merged = [(i, old_name, new_names[i]) for i, old_name, _ in top.changes if old_name != new_names[i]]
+            self._pop_history(self.undo_stack)
+            if merged:
+                self._push_history(self.undo_stack, HistoryEntry(merged))
+        else:
+            self._push_history(self.undo_stack, entry)
+        self._last_push_time = now
+    
+    def _pop_history(self, stack):
+        """Pop the newest entry from the undo or redo stack"""
+        entry = stack.pop()
+        self.history_bytes -= entry.cost
+        return entry
+    
+    def _clear_redo(self):
+        """Drop the redo stack after a new rename"""
+        self.history_bytes -= sum(entry.cost for entry in self.redo_stack)
+        self.redo_stack.clear()
+    
+    def _trim_history(self):
+        """Evict the oldest undo entries, then the farthest redo entries, until history fits the byte budget"""
+        max_bytes = self.history_config["max_bytes"]
+        # The newest undo entry is always kept
+        while self.history_bytes > max_bytes and len(self.undo_stack) > 1:
+            self.history_bytes -= self.undo_stack.popleft().cost
+        while self.history_bytes > max_bytes and self.redo_stack:
+            self.history_bytes -= self.redo_stack.popleft().cost
+    
+    def _apply_history_config(self):
+        """Apply history limits from the settings, re-bounding the existing stacks"""
+        config = self.settings.get("history_config", {})
+        for key, default in DEFAULT_HISTORY_CONFIG.items():
+            value = config.get(key, default)
+            self.history_config[key] = value if isinstance(value, int) and not isinstance(value, bool) and value > 0 else default
+        
+        max_depth = self.history_config["max_depth"]
+        self.undo_stack = collections.deque(self.undo_stack, maxlen=max_depth)
+        self.redo_stack = collections.deque(self.redo_stack, maxlen=max_depth)
+        self.history_bytes = sum(entry.cost for entry in self.undo_stack) + sum(entry.cost for entry in self.redo_stack)
+        self._trim_history()
         self.update_undo_redo_buttons()
     
+    def memory_usage(self):
+        """Return the number of history entries and their approximate size in bytes"""
+        return {
+            "entries": len(self.undo_stack) + len(self.redo_stack),
+            "bytes": self.history_bytes
+        }
+    
     def update_undo_redo_buttons(self):
         """Update undo/redo button states"""
-        # Only enable undo if we have more than one state and aren't at the beginning
-        self.undo_button.setEnabled(len(self.history) > 1 and self.history_index > 0)
-        
-        # Only enable redo if we're not at the end of history
-        self.redo_button.setEnabled(self.history_index < len(self.history) - 1)
-        
-        print(f"Undo/Redo status: {self.history_index}/{len(self.history) - 1}")
-        print(f"Undo enabled: {self.undo_button.isEnabled()}, Redo enabled: {self.redo_button.isEnabled()}")
+        # Only call setEnabled when the state actually flips, it repaints either way
+        can_undo = len(self.undo_stack) > 0
+        if can_undo != self._undo_enabled_cache:
+            self.undo_button.setEnabled(can_undo)
+            self._undo_enabled_cache = can_undo
+        
+        can_redo = len(self.redo_stack) > 0
+        if can_redo != self._redo_enabled_cache:
+            self.redo_button.setEnabled(can_redo)
+            self._redo_enabled_cache = can_redo
+        
+        if _DEBUG:
+            log.debug("Undo/Redo status: %d undo, %d redo", len(self.undo_stack), len(self.redo_stack))
     
     def undo(self):
         """Undo the last renaming operation"""
-        if self.history_index <= 0 or len(self.history) <= 1:
-            print("Nothing to undo")
+        if not self.undo_stack:
+            if _DEBUG:
+                log.debug("Nothing to undo")
             return
         
-        print(f"Undoing: moving from state {self.history_index} to {self.history_index - 1}")
-        self.history_index -= 1
-        self.restore_state(self.history[self.history_index])
+        # The next rename must not merge into whatever is now on top of the stack
+        self._last_push_time = 0.0
+        inverse = self._pop_history(self.undo_stack).inverted()
+        if _DEBUG:
+            log.debug("Undoing: restoring %d take name(s)", len(inverse.changes))
+        self.restore_state(inverse)
+        self._push_history(self.redo_stack, inverse)
         self.update_undo_redo_buttons()
     
     def redo(self):
         """Redo the previously undone operation"""
-        if self.history_index >= len(self.history) - 1:
-            print("Nothing to redo")
+        if not self.redo_stack:
+            if _DEBUG:
+                log.debug("Nothing to redo")
             return
         
-        print(f"Redoing: moving from state {self.history_index} to {self.history_index + 1}")
-        self.history_index += 1
-        self.restore_state(self.history[self.history_index])
+        self._last_push_time = 0.0
+        entry = self._pop_history(self.redo_stack).inverted()
+        if _DEBUG:
+            log.debug("Redoing: reapplying %d take name(s)", len(entry.changes))
+        self.restore_state(entry)
+        self._push_history(self.undo_stack, entry)
         self.update_undo_redo_buttons()
     
-    def restore_state(self, state):
-        """Restore take names from a saved state"""
-        system = FBSystem()
-        scene = system.Scene
-        
-        take_count = len(scene.Takes)
-        for i in range(take_count):
-            if i in state:
-                take = scene.Takes[i]
-                take.Name = state[i]
+    def restore_state(self, entry):
+        """Apply the new names of a history entry to the scene and the matching list rows"""
+        # Resolve the take list once and index only the changed takes
+        takes = self._all_takes()
+        take_count = len(takes)
+        if self.takes_list.count() != take_count:
+            # List is out of sync with the scene, so rows can't be patched individually
+            for i, _, new_name in entry.changes:
+                if i < take_count:
+                    takes[i].Name = new_name
+            self.populate_takes()
+            return
         
-        self.populate_takes()
+        # Only the changed takes and rows are touched
+        takes_list = self.takes_list
+        takes_list.setUpdatesEnabled(False)
+        try:
+            for i, _, new_name in entry.changes:
+                if i < take_count:
+                    takes[i].Name = new_name
+                    takes_list.item(i).setText(new_name)
+        finally:
+            takes_list.setUpdatesEnabled(True)
+        
+        # Restored names may now match (or stop matching) the filter
+        self.filter_takes()
     
     def show_help(self):
         """Show help information"""
-        help_text = """
-        <h2>Take Renamer Help</h2>
-        
-        <h3>Basic Usage</h3>
-        <p>Select one or more takes from the list, then use one of the renaming methods in the tabs below.</p>
-        
-        <h3>Renaming Options</h3>
-        <ul>
-            <li><b>Simple Rename</b>: Change the name of the selected takes.</li>
-            <li><b>Find and Replace</b>: Find text in take names and replace it.</li>
-            <li><b>Prefix/Suffix</b>: Add text before or after the take names.</li>
-        </ul>
-        
-        <h3>Preview</h3>
-        <p>Click the Preview button to see how the changes will look before applying them.</p>
-        
-        <h3>Undo/Redo</h3>
-        <p>Use the Undo and Redo buttons to revert or restore changes.</p>
-        
-        <h3>Keyboard Shortcuts</h3>
-        <ul>
-            <li><b>Ctrl+Z</b>: Undo</li>
-            <li><b>Ctrl+Y</b>: Redo</li>
-            <li><b>F5</b>: Refresh</li>
-            <li><b>Ctrl+F</b>: Focus filter</li>
-        </ul>
-        """
+        # The dialog (and its parsed HTML) is built on first use and reused afterwards
+        if self._help_dialog is None:
+            self._help_dialog = self._build_help_dialog()
+        
+        # Current undo history footprint, for diagnostics
+        usage = self.memory_usage()
+        self._help_history_label.setText(
+            f"Undo history: {usage['entries']} entries, {usage['bytes'] / 1024:.1f} KB "
+            f"(limit {self.history_config['max_depth']} entries, {self.history_config['max_bytes'] / (1 << 20):.0f} MB)")
         
+        self._help_dialog.exec_()
+    
+    def _build_help_dialog(self):
+        """Create the help dialog once"""
         help_dialog = QtWidgets.QDialog(self)
         help_dialog.setWindowTitle("Take Renamer Help")
         help_dialog.setMinimumWidth(500)
@@ -821,9 +983,12 @@ class TakeRenamerUI(QtWidgets.QDialog):
         layout = QtWidgets.QVBoxLayout(help_dialog)
         
         text_browser = QtWidgets.QTextBrowser()
-        text_browser.setHtml(help_text)
+        text_browser.setHtml(_HELP_HTML)
         layout.addWidget(text_browser)
         
+        self._help_history_label = QtWidgets.QLabel()
+        layout.addWidget(self._help_history_label)
+        
         button_layout = QtWidgets.QHBoxLayout()
         close_button = QtWidgets.QPushButton("Close")
         close_button.clicked.connect(help_dialog.close)
@@ -832,14 +997,15 @@ class TakeRenamerUI(QtWidgets.QDialog):
         
         layout.addLayout(button_layout)
         
-        help_dialog.exec_()
+        return help_dialog
     
     def load_settings(self):
         """Load settings from file"""
         try:
             if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    return json.load(f)
+                # One read of the whole (small) file, then parse from memory
+                with open(self.settings_file, 'r', buffering=65536) as f:
+                    return json.loads(f.read())
         except Exception:
             pass
         
@@ -849,33 +1015,148 @@ class TakeRenamerUI(QtWidgets.QDialog):
             "splitter_sizes": [300, 300]
         }
     
+    def _load_settings_deferred(self):
+        """Load settings after the dialog has been shown"""
+        self.settings = self.load_settings()
+        self._apply_history_config()
+        # Pin the history file to the scene open now, it may change while the dialog is up
+        self._history_path = self._history_file()
+        self.load_history()
+    
+    def _history_file(self):
+        """Path of the persisted undo history for the open scene, or None for an unsaved scene"""
+        scene_path = FBApplication().FBXFileName
+        if not scene_path:
+            return None
+        key = hashlib.md5(os.path.normcase(os.path.abspath(scene_path)).encode("utf-8")).hexdigest()
+        return f"{self.settings_file}.history.{key}"
+    
+    def _entry_matches_scene(self, entry, names):
+        """Check that the scene currently holds the names an entry would move away from"""
+        return all(i < len(names) and names[i] == new_name for i, _, new_name in entry.changes)
+    
+    def load_history(self):
+        """Restore undo/redo history saved for this scene by a previous session"""
+        if self.undo_stack or self.redo_stack:
+            return
+        
+        history_file = self._history_path
+        if history_file is None or not os.path.exists(history_file):
+            return
+        
+        try:
+            with open(history_file, 'r', buffering=65536) as f:
+                data = json.loads(f.read())
+            undo_entries = [HistoryEntry([tuple(change) for change in changes]) for changes in data.get("undo", [])]
+            redo_entries = [HistoryEntry([tuple(change) for change in changes]) for changes in data.get("redo", [])]
+        except Exception as e:
+            print(f"Error loading undo history: {str(e)}")
+            return
+        
+        # Only restore history that still lines up with the takes as they are now
+        names = self._snapshot_take_names()
+        if ((undo_entries and not self._entry_matches_scene(undo_entries[-1], names)) or
+                (redo_entries and not self._entry_matches_scene(redo_entries[-1], names))):
+            return
+        
+        for entry in undo_entries:
+            self._push_history(self.undo_stack, entry)
+        for entry in redo_entries:
+            self._push_history(self.redo_stack, entry)
+        self.update_undo_redo_buttons()
+    
+    def save_history(self):
+        """Persist the undo/redo history for this scene next to the settings file"""
+        history_file = self._history_path
+        if history_file is None:
+            return
+        if self._history_file() != history_file:
+            # Another scene was opened since; its indices don't match this history,
+            # and its own saved history must not be overwritten or removed
+            return
+        
+        try:
+            if not self.undo_stack and not self.redo_stack:
+                # Nothing to undo any more, so don't let an older history come back
+                if os.path.exists(history_file):
+                    os.remove(history_file)
+                return
+            
+            # Keep the newest undo entries that fit the on-disk budget
+            budget = HISTORY_FILE_MAX_BYTES - sum(entry.cost for entry in self.redo_stack)
+            undo_entries = []
+            for entry in reversed(self.undo_stack):
+                budget -= entry.cost
+                if budget < 0:
+                    break
+                undo_entries.append(entry.changes)
+            undo_entries.reverse()
+            
+            data = json.dumps({
+                "undo": undo_entries,
+                "redo": [entry.changes for entry in self.redo_stack]
+            }, separators=(',', ':'))
+            temp_file = history_file + '.tmp'
+            with open(temp_file, 'w', buffering=65536) as f:
+                f.write(data)
+            os.replace(temp_file, history_file)
+        except Exception as e:
+            print(f"Error saving undo history: {str(e)}")
+    
     def save_settings(self):
         """Save settings to file"""
         settings = {
             "window_size": [self.width(), self.height()],
-            "splitter_sizes": [300, 300]  # TODO: Get actual splitter sizes
+            "splitter_sizes": [300, 300],  # TODO: Get actual splitter sizes
+            "history_config": self.history_config
         }
         
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(settings, f)
+            # Serialize up front so the file gets a single write, and write to a temp
+            # file first so an interrupted save never leaves a truncated settings file
+            data = json.dumps(settings, separators=(',', ':'))
+            temp_file = self.settings_file + '.tmp'
+            with open(temp_file, 'w', buffering=65536) as f:
+                f.write(data)
+            os.replace(temp_file, self.settings_file)
         except Exception:
             pass
     
-    def closeEvent(self, event):
-        """Override close event to save settings"""
+    def _flush_settings(self):
+        """Write any pending settings change to disk now"""
+        self._settings_timer.stop()
         self.save_settings()
-        super(TakeRenamerUI, self).closeEvent(event)
+    
+    def resizeEvent(self, event):
+        """Save the new window size once resizing has settled"""
+        super(TakeRenamerUI, self).resizeEvent(event)
+        self._settings_timer.start()
+    
+    def done(self, result):
+        """Save settings and undo history however the dialog is dismissed"""
+        # Esc goes through reject() and never reaches closeEvent, while QDialog's
+        # closeEvent (Close button, title bar) itself calls reject(); both end up here
+        self._flush_settings()
+        self.save_history()
+        super(TakeRenamerUI, self).done(result)
     
     def keyPressEvent(self, event):
         """Handle keyboard shortcuts"""
-        if event.matches(QtGui.QKeySequence.Undo):
+        # Plain Ctrl+Z is by far the most repeated shortcut; catch it with a cheap key/modifier
+        # compare before falling back to QKeySequence matching
+        key = event.key()
+        if key == self._KEY_Z and event.modifiers() == self._CTRL:
+            self.undo()
+            return
+        
+        matches = event.matches
+        if matches(self._UNDO_SEQ):
             self.undo()
-        elif event.matches(QtGui.QKeySequence.Redo):
+        elif matches(self._REDO_SEQ):
             self.redo()
-        elif event.key() == QtCore.Qt.Key_F5:
+        elif key == self._KEY_F5:
             self.populate_takes()
-        elif event.matches(QtGui.QKeySequence.Find):
+        elif matches(self._FIND_SEQ):
             self.filter_input.setFocus()
             self.filter_input.selectAll()
         else:
@@ -891,7 +1172,7 @@ def show_take_renamer():
     
     try:
         # Get the MotionBuilder main window as parent  
-        mb_parent = get_motionbuilder_main_window()
+        mb_parent = _get_mb_window()
         
         g_take_renamer_dialog = TakeRenamerUI(parent=mb_parent)
         g_take_renamer_dialog.show()
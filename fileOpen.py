@@ -11,11 +11,31 @@ if script_dir not in sys.path:
 # Import the file browser module using the full path to each module
 from FileBrowser.file_browser import MotionBuilderFileBrowser
 
+def get_motionbuilder_main_window():
+    """Find the main MotionBuilder window/QWidget."""
+    app = QtWidgets.QApplication.instance()
+    
+    # Scripts are normally launched from inside the main window, so check the active window first
+    active_window = app.activeWindow()
+    if active_window is not None and active_window.objectName() == "MainWindow":
+        return active_window
+    
+    return next((w for w in app.topLevelWidgets() if w.objectName() == "MainWindow"), None)
+
+# The MotionBuilder main window lives for the whole session, so it is only looked up once
+_mb_main_window = None
+
+def _get_mb_window():
+    """Return the MotionBuilder main window, looking it up only on first use"""
+    global _mb_main_window
+    if _mb_main_window is None:
+        _mb_main_window = get_motionbuilder_main_window()
+    return _mb_main_window
+
 def show_file_browser():
     """Create and show the file browser dialog"""
     # Get main window as parent
-    app = QtWidgets.QApplication.instance()
-    parent = next((w for w in app.topLevelWidgets() if w.objectName() == "MainWindow"), None)
+    parent = _get_mb_window()
     
     dialog = MotionBuilderFileBrowser(parent)
     dialog.exec_()